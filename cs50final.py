@@ -1,10 +1,92 @@
 import sys
 import csv
 import os
-from datetime import datetime
+import re
+import functools
+import textwrap
+from itertools import zip_longest
+from operator import attrgetter
+from datetime import date, datetime
 from tabulate import tabulate
-from pyfiglet import Figlet, FigletError
-import cowsay
+
+# Buffer size used when reading and writing the internally managed CSV files, so each file is handled in as few system calls as possible
+CSV_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+# Tables with at least this many rows are laid out by _grid_table instead of tabulate, whose per-cell type detection dominates large tables
+GRID_TABLE_MIN_ROWS = 200
+
+
+def _nonneg_int(value, name):
+    """
+    Transforms a numerical string into an integer and ensures it is non-negative. Shared by the setters of integer attributes.
+
+    Args:
+        value (str): The value to transform.
+        name (str): The name of the attribute, used in error messages (ex: 'Option number').
+
+    Returns:
+        int: The value as a non-negative integer.
+
+    Raises:
+        ValueError: If the provided value is negative or cannot be cast to an integer.
+    """
+    try:
+        value = int(value)
+    except (ValueError, TypeError):
+        raise ValueError(f'{name} must be an integer')
+    if value < 0:
+        raise ValueError(f'{name} must be non-negative')
+    return value
+
+
+def _us_date_to_iso(us_date):
+    """
+    Converts a date formatted as MM/DD/YYYY, as in bank CSV files, into YYYY-MM-DD. The fields are split out directly
+    rather than parsed by strptime, which is far slower.
+
+    Args:
+        us_date (str): The date to convert.
+
+    Returns:
+        str: The date formatted as YYYY-MM-DD.
+
+    Raises:
+        ValueError: If the provided date is not a valid MM/DD/YYYY date.
+    """
+    month, day, year = us_date.split('/')
+    return date(int(year), int(month), int(day)).isoformat()
+
+
+def _grid_table(headers, rows, right_aligned):
+    """
+    Formats rows of strings as a table laid out like tabulate's 'grid' format, measuring the column widths in one pass
+    and filling in a single format template per row. Like tabulate, whitespace around each cell is stripped. Unlike tabulate,
+    every character is counted as one column wide, so cells must be single-line, printable ASCII text.
+
+    Args:
+        headers (list): The column headers.
+        rows (list): The rows to display, each a sequence of single-line, printable ASCII strings in the same order as the headers.
+        right_aligned (list): For each column, True if it holds numbers and is right-aligned, False if it is left-aligned.
+
+    Returns:
+        str: The formatted table.
+    """
+    rows = [[cell.strip() for cell in row] for row in rows]
+
+    # Like tabulate, leave room for at least two extra spaces around each header
+    widths = [len(header) + 2 for header in headers]
+    for i, column in enumerate(zip(*rows)):
+        widths[i] = max(widths[i], max(map(len, column)))
+
+    template = '| ' + ' | '.join(f"{{:{'>' if right else '<'}{width}}}" for width, right in zip(widths, right_aligned)) + ' |'
+    row_separator = '+' + '+'.join('-' * (width + 2) for width in widths) + '+'
+    header_separator = row_separator.replace('-', '=')
+
+    table = [row_separator, template.format(*headers), header_separator]
+    for row in rows:
+        table.append(template.format(*row))
+        table.append(row_separator)
+    return '\n'.join(table)
 
 
 class BudgetCategory:
@@ -27,6 +109,9 @@ class BudgetCategory:
         search_order (str): The search order of the budget category.
     """
 
+    # Fixed set of attributes, so objects don't need a per-instance __dict__
+    __slots__ = ('general_classification', 'budget_category', '_keywords', '_keyword_pattern', '_option_num', '_amt_budgeted', '_search_order')
+
     def __init__(self, general_classification: str, budget_category: str, keywords: str, option_num: str, amt_budgeted: str, search_order: str):
         """
         Initializes a BudgetCategory object with the provided attributes.
@@ -39,8 +124,9 @@ class BudgetCategory:
             amt_budgeted (str): The amount budgeted for the category.
             search_order (str): The search order of the budget category.
         """
-        self.general_classification = general_classification
-        self.budget_category = budget_category
+        # Names come from a small, fixed vocabulary, so interning them lets every reference share one string
+        self.general_classification = sys.intern(general_classification)
+        self.budget_category = sys.intern(budget_category)
         self.keywords = keywords
         self.option_num = option_num
         self.amt_budgeted = amt_budgeted
@@ -49,27 +135,51 @@ class BudgetCategory:
     def __str__(self):
         """
         Returns a string representation of the BudgetCategory object's attributes as stored in memory.
-        Keywords are stored in memory as a list, option number and search order as integers, and amount budgeted as a float.
+        Keywords are stored in memory as a tuple of strings as they were entered, option number and search order as integers, and amount budgeted as a float.
 
         Returns:
             str: The string representation of the BudgetCategory object's attributes, labeled.
         """
         return f"General Classification: {self.general_classification}\nBudget Category: {self.budget_category}\nKeywords: {self.keywords}\nOption Number: {self.option_num}\nAmount Budgeted: {self.amt_budgeted}\nSearch Order: {self.search_order}"
 
+    @classmethod
+    def from_trusted_row(cls, row):
+        """
+        Creates a BudgetCategory object from a row of the internally created and managed budgets CSV file.
+        That file is only ever written by this program, so its rows are already valid and the numerical
+        attributes are converted directly instead of going through the validating setters.
+
+        Args:
+            row (list): The row's values in BudgetManager.BUDGETS_CSV_HEADER order.
+
+        Returns:
+            BudgetCategory: The BudgetCategory object built from the row.
+        """
+        category_obj = cls.__new__(cls)
+        category_obj.general_classification = sys.intern(row[0])
+        category_obj.budget_category = sys.intern(row[1])
+        category_obj.keywords = row[2]  # Setter also compiles the keyword pattern
+        category_obj._option_num = int(row[3])
+        category_obj._amt_budgeted = float(row[4])
+        category_obj._search_order = int(row[5])
+        return category_obj
+
     @property
     def keywords(self):
         """
         Getter method for the keywords attribute.
 
         Returns:
-            list: The list of keywords associated with the budget category.
+            tuple: The keywords associated with the budget category, as they were entered.
         """
         return self._keywords
 
     @keywords.setter
     def keywords(self, keywords: str):
         """
-        Setter method for the keywords attribute. Transforms a string of keywords separated by '|' into a list of keywords stored in memory.
+        Setter method for the keywords attribute. Transforms a string of keywords separated by '|' into a tuple of keywords stored
+        in memory as they were entered, so they are written back to the budgets file unchanged. Keywords are lowercased once here,
+        for the keyword pattern, rather than each time they are compared.
 
         Args:
             keywords (str): The keywords to set for the budget category. Expects a list of keywords separated by '|'.
@@ -79,7 +189,20 @@ class BudgetCategory:
         """
         if not isinstance(keywords, str):
             raise ValueError("Keywords must be entered as a string.")
-        self._keywords = keywords.split('|')
+        self._keywords = tuple(keywords.split('|'))
+        # Compiled once here so categorization makes a single regex search per category. Keywords are lowercased, so the pattern
+        # is matched against lowercased descriptions rather than compiled with re.IGNORECASE, which is several times slower to search
+        self._keyword_pattern = re.compile('|'.join(re.escape(keyword.lower()) for keyword in self._keywords))
+
+    @property
+    def keyword_pattern(self):
+        """
+        Getter method for the keyword_pattern attribute. There is no setter, as the pattern is compiled by the keywords setter.
+
+        Returns:
+            re.Pattern: A pattern matching any of the lowercase keywords associated with the budget category.
+        """
+        return self._keyword_pattern
 
     @property
     def option_num(self):
@@ -102,13 +225,7 @@ class BudgetCategory:
         Raises:
             ValueError: If the provided option number is negative or cannot be cast to an integer.
         """
-        try:
-            option_num = int(option_num)
-            if option_num < 0:
-                raise ValueError('Option number must be non-negative')
-        except ValueError:
-            raise ValueError('Option number must be an integer')
-        self._option_num = option_num
+        self._option_num = _nonneg_int(option_num, 'Option number')
 
     @property
     def amt_budgeted(self):
@@ -133,11 +250,11 @@ class BudgetCategory:
         """
         try:
             amt_budgeted = round(float(amt_budgeted), 2)
-            if amt_budgeted < 0:
-                raise ValueError('Budgeted amount must be non-negative')
-        except ValueError:
+        except (ValueError, TypeError):
             raise ValueError(
                 'Must be a dollar amount without a currency symbol (ex: 25.75, not $25.75)')
+        if amt_budgeted < 0:  # Checked outside the try block so this message isn't replaced by the one above
+            raise ValueError('Budgeted amount must be non-negative')
         self._amt_budgeted = amt_budgeted
 
     @property
@@ -161,13 +278,7 @@ class BudgetCategory:
         Raises:
             ValueError: If the provided search order is negative or cannot be cast to an integer.
         """
-        try:
-            search_order = int(search_order)
-            if search_order < 0:
-                raise ValueError('Search order must be non-negative')
-        except ValueError:
-            raise ValueError('Search order must be an integer')
-        self._search_order = search_order
+        self._search_order = _nonneg_int(search_order, 'Search order')
 
 
 class Transaction:
@@ -185,6 +296,9 @@ class Transaction:
         category (str): The category of the transaction (default: 'Uncategorized').
     """
 
+    # Fixed set of attributes, so objects don't need a per-instance __dict__
+    __slots__ = ('_source_file', '_transaction_num', '_transaction_date', '_amount', 'description', '_category')
+
     def __init__(self, transaction_num: str, transaction_date: str, amount: str, description: str, category: str = 'Uncategorized', source_file: str = 'sample.csv'):
         """
         Initializes a Transaction object with the provided attributes.
@@ -214,6 +328,28 @@ class Transaction:
         """
         return f"Source: {self.source_file}\nTransaction Number: {self.transaction_num}\nDate: {self.transaction_date}\nAmount: {self.amount}\nDescription: {self.description}\nCategory: {self.category}"
 
+    @classmethod
+    def from_trusted_row(cls, row):
+        """
+        Creates a Transaction object from a row of the internally created and managed transactions CSV file.
+        That file is only ever written by this program, so its rows are already valid and the attributes
+        are converted directly instead of going through the validating setters.
+
+        Args:
+            row (list): The row's values in TransactionsManager.TRANSACTIONS_CSV_HEADER order, with the date as YYYY-MM-DD.
+
+        Returns:
+            Transaction: The Transaction object built from the row.
+        """
+        transaction_obj = cls.__new__(cls)
+        transaction_obj._transaction_num = int(row[0])
+        transaction_obj._transaction_date = datetime.fromisoformat(row[1])
+        transaction_obj._amount = float(row[2])
+        transaction_obj.description = row[3]
+        transaction_obj._category = sys.intern(row[4])
+        transaction_obj._source_file = row[5]
+        return transaction_obj
+
     @property
     def source_file(self):
         """
@@ -260,13 +396,7 @@ class Transaction:
         Raises:
             ValueError: If the provided transaction number is negative, or cannot be cast to an integer.
         """
-        try:
-            transaction_num = int(transaction_num)
-            if transaction_num < 0:
-                raise ValueError('Transaction number must be non-negative')
-        except ValueError:
-            raise ValueError('Transaction number must be an integer')
-        self._transaction_num = transaction_num
+        self._transaction_num = _nonneg_int(transaction_num, 'Transaction number')
 
     @property
     def transaction_date(self):
@@ -289,9 +419,13 @@ class Transaction:
         Raises:
             ValueError: If the provided transaction date is not a valid date.
         """
+        # Dates are always YYYY-MM-DD, which fromisoformat parses much faster than strptime with a format string.
+        # The shape is checked first because fromisoformat also accepts other ISO 8601 forms, such as dates with times.
         try:
-            transaction_date = datetime.strptime(transaction_date, '%Y-%m-%d')
-        except ValueError:
+            if len(transaction_date) != 10 or transaction_date[4] != '-' or transaction_date[7] != '-':
+                raise ValueError
+            transaction_date = datetime.fromisoformat(transaction_date)
+        except (ValueError, TypeError):
             raise ValueError('Must be a valid date')
         self._transaction_date = transaction_date
 
@@ -308,21 +442,48 @@ class Transaction:
     @amount.setter
     def amount(self, amount: str):
         """
-        Setter method for the amount attribute. Transforms a string to a float and ensures the input is non-negative.
+        Setter method for the amount attribute. Transforms a string to a float. Amounts may be negative,
+        as bank CSV files show transactions going out of the account as negative amounts.
 
         Args:
             amount (str): The amount to set for the transaction.
 
         Raises:
-            ValueError: If the provided amount is negative or cannot be cast to a float.
+            ValueError: If the provided amount cannot be cast to a float.
         """
         try:
             amount = round(float(amount), 2)
-        except ValueError:
+        except (ValueError, TypeError):
             raise ValueError(
                 'Must be a dollar amount without a currency symbol (ex: 25.75, not $25.75)')
         self._amount = amount
 
+    @property
+    def category(self):
+        """
+        Getter method for the category attribute.
+
+        Returns:
+            str: The budget category of the transaction.
+        """
+        return self._category
+
+    @category.setter
+    def category(self, category: str):
+        """
+        Setter method for the category attribute. Categories come from a small, fixed set of budget category names,
+        so they are interned, letting every transaction in the same category share a single string.
+
+        Args:
+            category (str): The budget category to set for the transaction.
+
+        Raises:
+            ValueError: If the provided category is not a string.
+        """
+        if not isinstance(category, str):
+            raise ValueError("Category must be a string")
+        self._category = sys.intern(category)
+
 
 class BudgetManager:
     """
@@ -332,10 +493,54 @@ class BudgetManager:
         budgets_csv_file (str): The internally created and managed CSV file storing the budget data (default: 'current_budgets.csv').
         budget_categories (dict): Dictionary mapping budget categories to BudgetCategory objects.
         budget_menu (str): String representation of the budget menu display.
-        income_by_category (dict): Dictionary mapping income categories to their respective totals.
-        expenditures_by_category (dict): Dictionary mapping expenditure categories to their respective totals.
+        income_by_category (dict): Dictionary mapping income categories to their respective totals (read-only view of the totals).
+        expenditures_by_category (dict): Dictionary mapping expenditure categories to their respective totals (read-only view of the totals).
     """
 
+    # Column order of the budgets CSV file, matching the order of the BudgetCategory constructor arguments
+    BUDGETS_CSV_HEADER = ['general_classification', 'budget_category', 'keywords', 'option_num', 'amt_budgeted', 'search_order']
+
+    # Default budget categories, as rows in BUDGETS_CSV_HEADER order
+    DEFAULT_BUDGET_CATEGORIES = (
+        ('Income', 'Paycheck', 'payroll', '1', '0', '1'),
+        ('Income', 'Other Income', 'cashout', '2', '0', '2'),
+        ('Monthly Household Bills', 'Mortgage & Rent',
+         'apartments|mortgage', '3', '0', '3'),
+        ('Monthly Household Bills', 'Utilities',
+         'utility|gas|electric|water|smud|pge', '4', '0', '4'),
+        ('Monthly Household Bills', 'Phone',
+         'verizon|metropcs|mobile', '5', '0', '5'),
+        ('Monthly Household Bills', 'Internet, Cable, Satellite',
+         'internet|comcast|xfinity|at&t|cable|satellite', '6', '0', '6'),
+        ('Food & Dining', 'Groceries',
+         'safeway|kroger|aldi|publix|meijer|piggly|albertson|costco|trader joe|co-op|food|market|grocery', '7', '0', '7'),
+        ('Food & Dining', 'Eating Out',
+         'mcdonald|starbuck|peets|chipotle|subway|panera|dunkin|taco|pizza|wings|burger|steak|coffee|yogurt', '8', '0', '8'),
+        ('Travel & Transport', 'Car (Payment, Gas, Repair, Ride Share, Tolls, Parking)',
+         'dealership|auto|uber|lyft|toll|parking|shell|chevron|exxonmobil|bp|gas', '9', '0', '9'),
+        ('Travel & Transport', 'Public Transit',
+         'transit| rt ', '10', '0', '10'),
+        ('Travel & Transport', 'Trips & Travel',
+         'hotel|motel|airline', '11', '0', '14'),
+        ('Health & Fitness', 'Medical',
+         'hospital|doctor|kaiser|medical|insurance|wellness|pharm|rx', '12', '0', '17'),
+        ('Health & Fitness', 'Gym & Other Fitness',
+         'fitness|gym|pilates|dance|running', '13', '0', '13'),
+        ('Financial', 'Pay Loans & Credit Cards',
+         'bank|loan|capital one|merrick|hsbc|american express|visa|mastercard|student ln|synchrony| cc ', '14', '0', '11'),
+        ('Shopping', 'Home Improvement', 'lowe|home|hardware', '15', '0', '15'),
+        ('Shopping', 'Other Shopping',
+         'amazon|amzn|ebay|macy|nordstrom|target|walmart|outlet|google', '16', '0', '999'),
+        ('Other', 'Self Care',
+         'spa | hair|nail|salon|barber|massage|beauty', '17', '0', '17'),
+        ('Other', 'Pet Care',
+         'chewy|animal|vet|kitty|cat |dog|hound|pup', '18', '0', '12'),
+        ('Other', 'Laundry', 'csc', '19', '0', '19'),
+        ('Other', 'Entertainment',
+         'netflix|hulu|disney|video|spotify|audible|cinemark|amc|theater|theatre|playstation|nintendo|xbox|steam|nexus mods|game|subscription|youtube|channel|television|tv',
+         '20', '0', '20'),
+    )
+
     def __init__(self, budgets_csv_file: str = 'current_budgets.csv'):
         """
         Initializes a BudgetManager object and sets the name of the internally created and managed CSV file for storing budget data.
@@ -346,91 +551,73 @@ class BudgetManager:
         self.budgets_csv_file = budgets_csv_file
 
         # Dictionary with BudgetCategory objects as values, and their budget_category attribute as keys
-        self.budget_categories = self.initialize_default_budget_categories()
-        self.budget_menu = self.initialize_budget_menu() # String representation of menu display
-
-        # Used to calculate expenditures by budget category
-        self.income_by_category = {}
-        self.expenditures_by_category = {'Uncategorized': 0}
-
-        # Create two dictionaries with budget categories as keys and totals by budget category as values
-        for category in self.budget_categories:
-            if self.budget_categories[category].general_classification == 'Income':
-                self.income_by_category[category] = 0
-            else:
-                self.expenditures_by_category[category] = 0
+        # Assigning it also starts every budget category's total at zero
+        self._assign_budget_categories(self.initialize_default_budget_categories())
 
     def initialize_default_budget_categories(self):
         """
-        Initializes the default budget categories. Takes a list of BudgetCategory objects,
+        Initializes the default budget categories. Builds a list of BudgetCategory objects from the DEFAULT_BUDGET_CATEGORIES rows,
         then makes those objects the values of the dictionary, with their own budget_category attributes as keys.
 
         Returns:
             dict: Dictionary mapping budget categories to BudgetCategory objects.
         """
 
-        self.category_objects = [
-            BudgetCategory('Income', 'Paycheck', 'payroll', '1', '0', '1'),
-            BudgetCategory('Income', 'Other Income', 'cashout', '2', '0', '2'),
-            BudgetCategory('Monthly Household Bills', 'Mortgage & Rent',
-                           'apartments|mortgage', '3', '0', '3'),
-            BudgetCategory('Monthly Household Bills', 'Utilities',
-                           'utility|gas|electric|water|smud|pge', '4', '0', '4'),
-            BudgetCategory('Monthly Household Bills', 'Phone',
-                           'verizon|metropcs|mobile', '5', '0', '5'),
-            BudgetCategory('Monthly Household Bills', 'Internet, Cable, Satellite',
-                           'internet|comcast|xfinity|at&t|cable|satellite', '6', '0', '6'),
-            BudgetCategory('Food & Dining', 'Groceries',
-                           'safeway|kroger|aldi|publix|meijer|piggly|albertson|costco|trader joe|co-op|food|market|grocery', '7', '0', '7'),
-            BudgetCategory('Food & Dining', 'Eating Out',
-                           'mcdonald|starbuck|peets|chipotle|subway|panera|dunkin|taco|pizza|wings|burger|steak|coffee|yogurt', '8', '0', '8'),
-            BudgetCategory('Travel & Transport', 'Car (Payment, Gas, Repair, Ride Share, Tolls, Parking)',
-                           'dealership|auto|uber|lyft|toll|parking|shell|chevron|exxonmobil|bp|gas', '9', '0', '9'),
-            BudgetCategory('Travel & Transport', 'Public Transit',
-                           'transit| rt ', '10', '0', '10'),
-            BudgetCategory('Travel & Transport', 'Trips & Travel',
-                           'hotel|motel|airline', '11', '0', '14'),
-            BudgetCategory('Health & Fitness', 'Medical',
-                           'hospital|doctor|kaiser|medical|insurance|wellness|pharm|rx', '12', '0', '17'),
-            BudgetCategory('Health & Fitness', 'Gym & Other Fitness',
-                           'fitness|gym|pilates|dance|running', '13', '0', '13'),
-            BudgetCategory('Financial', 'Pay Loans & Credit Cards',
-                           'bank|loan|capital one|merrick|hsbc|american express|visa|mastercard|student ln|synchrony| cc ', '14', '0', '11'),
-            BudgetCategory('Shopping', 'Home Improvement', 'lowe|home|hardware', '15', '0', '15'),
-            BudgetCategory('Shopping', 'Other Shopping',
-                           'amazon|amzn|ebay|macy|nordstrom|target|walmart|outlet|google', '16', '0', '999'),
-            BudgetCategory('Other', 'Self Care',
-                           'spa | hair|nail|salon|barber|massage|beauty', '17', '0', '17'),
-            BudgetCategory('Other', 'Pet Care',
-                           'chewy|animal|vet|kitty|cat |dog|hound|pup', '18', '0', '12'),
-            BudgetCategory('Other', 'Laundry', 'csc', '19', '0', '19'),
-            BudgetCategory('Other', 'Entertainment',
-                           'netflix|hulu|disney|video|spotify|audible|cinemark|amc|theater|theatre|playstation|nintendo|xbox|steam|nexus mods|game|subscription|youtube|channel|television|tv',
-                           '20', '0', '20'),
-        ]
+        self.category_objects = [BudgetCategory.from_trusted_row(row) for row in self.DEFAULT_BUDGET_CATEGORIES]
         return {category_obj.budget_category: category_obj for category_obj in self.category_objects}
 
-    def initialize_budget_menu(self):
+    @functools.cached_property
+    def budget_menu(self):
         """
-        Initializes the budget menu display.
+        String representation of the budget menu display, generated from the budget categories. Categories are grouped
+        under their general classification, and the groups are laid out side by side, four to a row, so the menu doesn't
+        take up a tall column of the screen. Built the first time it is needed, then cached.
 
         Returns:
             str: String representation of the budget menu display.
         """
-        budget_menu = "\nAVAILABLE CATEGORIES:\n\n"
-        budget_menu += "\x1B[4mINCOME\x1B[0m             \x1B[4mMONTHLY HOUSEHOLD\x1B[0m      \x1B[4mFOOD & DINING\x1B[0m          \x1B[4mTRAVEL & TRANSPORT\x1B[0m\n"
-        budget_menu += " 1: Paycheck        3: Mortgage & Rent     7: Groceries           9: Car (Payment, Gas, Repair,\n"
-        budget_menu += " 2: Other Income    4: Utilities           8: Eating Out             Ride Share, Tolls, Parking)\n"
-        budget_menu += "                    5: Phone                                     10: Public Transit\n"
-        budget_menu += "                    6: Internet, Cable,                          11: Trips & Travel\n"
-        budget_menu += "                       Satellite\n\n"
-        budget_menu += "\x1B[4mHEALTH & FITNESS\x1B[0m   \x1B[4mFINANCIAL\x1B[0m              \x1B[4mSHOPPING\x1B[0m               \x1B[4mOTHER\x1B[0m\n"
-        budget_menu += "12: Medical        14: Pay Loans &        15: Home Improvement   17: Self Care\n"
-        budget_menu += "13: Gym & Other        Credit Cards       16: Other Shopping     18: Pet Care\n"
-        budget_menu += "    Fitness                                                      19: Laundry\n"
-        budget_menu += "                                                                 20: Entertainment"
-
-        return budget_menu
+        column_width = 24
+        groups_per_row = 4
+
+        # Group categories by general classification, in option number order
+        groups = {}
+        for category in sorted(self.budget_categories.values(), key=lambda x: x.option_num):
+            groups.setdefault(category.general_classification, []).append(category)
+
+        columns = []
+        for general_classification, categories in groups.items():
+            # The underline escape codes take up no space on screen, so pad the title before adding them
+            title = general_classification.upper()
+            column = [f"\x1B[4m{title}\x1B[0m{' ' * (column_width - len(title))}"]
+            for category in categories:
+                # Long category names wrap onto further lines, indented past the option number
+                option_lines = textwrap.wrap(f"{category.option_num:>2}: {category.budget_category}",
+                                             width=column_width - 1, subsequent_indent='    ')
+                column.extend(line.ljust(column_width) for line in option_lines)
+            columns.append(column)
+
+        menu_rows = []
+        for i in range(0, len(columns), groups_per_row):
+            lines = zip_longest(*columns[i:i + groups_per_row], fillvalue=' ' * column_width)
+            menu_rows.append('\n'.join(''.join(line).rstrip() for line in lines))
+
+        return "\nAVAILABLE CATEGORIES:\n\n" + '\n\n'.join(menu_rows)
+
+    def build_category_lookups(self):
+        """
+        Builds the lookups used to categorize transactions and select budget categories. The budget categories are sorted
+        by search order once, here, rather than every time a transaction is categorized, any previously cached categorizations
+        are discarded, the categories are indexed by option number for menu selections, their names are split into income
+        and expenditure categories for the totals views, and the cached budget menu is cleared.
+        """
+        self._ordered_categories = sorted(self.budget_categories.values(), key=lambda x: x.search_order) # Sorted function returns a list
+        # Bound search methods of the lowercase keyword patterns, paired with their budget categories in search order
+        self._keyword_searches = [(category.keyword_pattern.search, category.budget_category) for category in self._ordered_categories]
+        self._category_cache = {}  # Descriptions already categorized with these categories, mapped to their budget category
+        self._by_option_num = {category.option_num: category for category in self.budget_categories.values()}
+        self._income_categories = [name for name, category in self.budget_categories.items() if category.general_classification == 'Income']
+        self._expenditure_categories = [name for name, category in self.budget_categories.items() if category.general_classification != 'Income']
+        self.__dict__.pop('budget_menu', None)  # Regenerate the cached budget menu from these categories when it is next shown
 
     @property
     def budgets_csv_file(self):
@@ -483,65 +670,48 @@ class BudgetManager:
             raise TypeError("budget_categories must be a dictionary")
         if not all(isinstance(category, BudgetCategory) for category in budget_categories.values()):
             raise ValueError("All values in budget_categories must be BudgetCategory instances")
-        self._budget_categories = budget_categories
+        self._assign_budget_categories(budget_categories)
 
-    @property
-    def expenditures_by_category(self):
+    def _assign_budget_categories(self, budget_categories: dict):
         """
-        Getter method for the expenditures_by_category attribute.
+        Assigns a dictionary of budget categories without validating it, then rebuilds everything that depends on the categories.
+        Used directly where this class has just built the dictionary from BudgetCategory objects itself, skipping the setter's
+        check of every value. Any other dictionary should be assigned through the budget_categories setter.
 
-        Returns:
-            dict: Dictionary mapping expenditure categories to their respective totals.
+        Args:
+            budget_categories (dict): Dictionary mapping budget categories to BudgetCategory objects.
         """
-        return self._expenditures_by_category
+        self._budget_categories = budget_categories
+        self.build_category_lookups()  # Keep the categorization lookups in step with the categories they were built from
+        self.reset_totals()  # Totals are kept by budget category, so start over with these categories
 
-    @expenditures_by_category.setter
-    def expenditures_by_category(self, expenditures_by_category):
+    @property
+    def expenditures_by_category(self):
         """
-        Setter method for the expenditures_by_category attribute.
+        Getter method for the expenditures_by_category attribute. Built on demand from the totals by budget category, with the signs
+        switched so amounts going out of the account display as positive amounts. There is no setter, as totals are changed through
+        reset_totals and add_to_totals.
 
-        Args:
-            expenditures_by_category (dict): Dictionary mapping expenditure categories to their respective totals.
-
-        Raises:
-            TypeError: If the provided expenditures_by_category is not a dictionary.
-            ValueError: If any key in expenditures_by_category is not a string or any value is not a number.
+        Returns:
+            dict: Dictionary mapping 'Uncategorized' and the expenditure categories to their respective totals.
         """
-        if not isinstance(expenditures_by_category, dict):
-            raise TypeError("expenditures_by_category must be a dictionary")
-        if not all(isinstance(k, str) and isinstance(v, (int, float)) for k, v in expenditures_by_category.items()):
-            raise ValueError(
-                "All keys in expenditures_by_category must be strings and all values must be numbers")
-        self._expenditures_by_category = expenditures_by_category
+        totals = self._totals_by_category
+        expenditures_by_category = {'Uncategorized': 0.0 - totals['Uncategorized']}
+        for category in self._expenditure_categories:
+            expenditures_by_category[category] = 0.0 - totals[category]
+        return expenditures_by_category
 
     @property
     def income_by_category(self):
         """
-        Getter method for the income_by_category attribute.
+        Getter method for the income_by_category attribute. Built on demand from the totals by budget category.
+        There is no setter, as totals are changed through reset_totals and add_to_totals.
 
         Returns:
             dict: Dictionary mapping income categories to their respective totals.
         """
-        return self._income_by_category
-
-    @income_by_category.setter
-    def income_by_category(self, income_by_category):
-        """
-        Setter method for the income_by_category attribute.
-
-        Args:
-            income_by_category (dict): Dictionary mapping income categories to their respective totals.
-
-        Raises:
-            TypeError: If the provided income_by_category is not a dictionary.
-            ValueError: If any key in income_by_category is not a string or any value is not a number.
-        """
-        if not isinstance(income_by_category, dict):
-            raise TypeError("expenditures_by_category must be a dictionary")
-        if not all(isinstance(k, str) and isinstance(v, (int, float)) for k, v in income_by_category.items()):
-            raise ValueError(
-                "All keys in expenditures_by_category must be strings and all values must be numbers")
-        self._income_by_category = income_by_category
+        totals = self._totals_by_category
+        return {category: totals[category] for category in self._income_categories}
 
     def __str__(self):
         """
@@ -559,22 +729,16 @@ class BudgetManager:
     def get_stored_budgets(self):
         """
         Reads in the stored budget data from the CSV file.
-        If the file doesn't exist, initializes it with default data.
+        If the file doesn't exist, keeps the default data already in memory. The file is created the first time a budget amount changes,
+        so a session that only views budgets doesn't write defaults to disk just to read them back the next time.
         """
-        if not os.path.exists(self.budgets_csv_file):
-            self.update_stored_budgets()  # Initialize the file with default data
-        else:
-            with open(self.budgets_csv_file, 'r', newline='') as file:
-                reader = csv.DictReader(file)
-                self.budget_categories = {}  # Prepare to load categories from file
-                for row in reader:
-                    self.budget_categories[row['budget_category']] = BudgetCategory(
-                        row['general_classification'],
-                        row['budget_category'],
-                        row['keywords'],
-                        row['option_num'],
-                        row['amt_budgeted'],
-                        row['search_order'])
+        if os.path.exists(self.budgets_csv_file):
+            with open(self.budgets_csv_file, 'r', buffering=CSV_BUFFER_SIZE, newline='') as file:
+                reader = csv.reader(file)
+                next(reader, None)  # Skip the header row
+                # Build every category in a single pass before replacing the ones in memory
+                budget_categories = {row[1]: BudgetCategory.from_trusted_row(row) for row in reader}
+            self._assign_budget_categories(budget_categories)
 
     def get_budget_category_to_update(self):
         """
@@ -591,10 +755,8 @@ class BudgetManager:
         if selection.lower() == 'q':
             return 'q'  # Lets calling function know user wants to quit out of current menu
         try:
-            for category in self.budget_categories.values():
-                if int(selection) == category.option_num:
-                    return category.budget_category
-        except ValueError:
+            return self._by_option_num[int(selection)].budget_category
+        except (KeyError, ValueError):
             return None
 
     def get_new_budget_amt(self, category):
@@ -644,8 +806,10 @@ class BudgetManager:
                 if new_budget_amt < 0:  # Validate user input as positive or zero
                     print("Budget amount must be 0.00 or greater")
                     continue
-                self.budget_categories[category_to_update].amt_budgeted = new_budget_amt
-                self.update_stored_budgets()
+                category_obj = self.budget_categories[category_to_update]
+                if new_budget_amt != category_obj.amt_budgeted:  # Only rewrite the stored budgets when the amount actually changed
+                    category_obj.amt_budgeted = new_budget_amt
+                    self.update_stored_budgets()
                 print(self.format_budgets_with_expenditures())
                 break
 
@@ -654,19 +818,58 @@ class BudgetManager:
         Updates the stored budget data in the CSV file with the current budget data.
         Overwrites whatever was in the file with the data currently in memory.
         """
-        with open(self.budgets_csv_file, 'w', newline='') as file:
-            writer = csv.DictWriter(file, fieldnames=[
-                                    'general_classification', 'budget_category', 'keywords', 'option_num', 'amt_budgeted', 'search_order'])
-            writer.writeheader()
-            for category_obj in self.budget_categories.values():
-                writer.writerow({
-                    'general_classification': category_obj.general_classification,
-                    'budget_category': category_obj.budget_category,
-                    'keywords': '|'.join(category_obj.keywords),
-                    'option_num': str(category_obj.option_num),
-                    'amt_budgeted': f"{category_obj.amt_budgeted:.2f}",
-                    'search_order': str(category_obj.search_order)
-                })
+        with open(self.budgets_csv_file, 'w', buffering=CSV_BUFFER_SIZE, newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(self.BUDGETS_CSV_HEADER)
+            writer.writerows((
+                category_obj.general_classification,
+                category_obj.budget_category,
+                '|'.join(category_obj.keywords),
+                str(category_obj.option_num),
+                f"{category_obj.amt_budgeted:.2f}",
+                str(category_obj.search_order)
+            ) for category_obj in self.budget_categories.values())
+
+    def reset_totals(self):
+        """
+        Sets the totals of every budget category, including 'Uncategorized', back to zero. Totals are kept in a single dictionary,
+        with amounts as shown on the bank's CSV files (positive coming into the account, negative going out of it).
+        The income_by_category and expenditures_by_category views are built from it.
+        """
+        self._totals_by_category = dict.fromkeys(self.budget_categories, 0.0)
+        self._totals_by_category['Uncategorized'] = 0.0
+
+    def add_to_totals(self, category, amount):
+        """
+        Adds a single transaction amount to the total of its budget category. A negative amount takes a transaction back out
+        of a category's total. Amounts for categories that aren't budget categories are added to 'Uncategorized'.
+
+        Args:
+            category (str): The budget category of the transaction.
+            amount (float): The amount of the transaction, as shown on the bank's CSV file.
+        """
+        if category not in self._totals_by_category:
+            category = 'Uncategorized'
+        # Amounts are whole cents, so rounding keeps amounts moved between categories from leaving floating-point residue,
+        # and 'or 0.0' turns a rounded -0.0 into 0.0 so it doesn't display as -0.00
+        self._totals_by_category[category] = round(self._totals_by_category[category] + amount, 2) or 0.0
+
+    def add_transactions_to_totals(self, transactions):
+        """
+        Adds a whole collection of transactions to the totals by budget category, in the same way as add_to_totals.
+        Amounts are first summed per category in a single pass, then each category's sum is added to the totals once,
+        so the per-transaction work is a single dictionary update.
+
+        Args:
+            transactions (iterable): The Transaction objects to add to the totals.
+        """
+        sums_by_category = {}
+        get_sum = sums_by_category.get  # Bound once for the whole loop
+        for transaction in transactions:
+            category = transaction.category  # Read the property once per transaction
+            sums_by_category[category] = get_sum(category, 0.0) + transaction.amount
+        for category, amount in sums_by_category.items():
+            self.add_to_totals(category, amount)
 
     def format_budgets_with_expenditures(self, transactions_source=None):
         """
@@ -678,36 +881,37 @@ class BudgetManager:
         Returns:
             str: The formatted string representing the budgets with expenditures.
         """
-        # Initialize headers and lists for income and expenditures
+        # Initialize headers for income and expenditures
         income_headers = ['Income Category', 'Expected', 'Received', 'Pending']
         expenditures_headers = ['Budget Category', 'Budgeted', 'Expended', 'Remaining']
-        income_data, expenditures_data = [], []
 
-        # Initialize totals
-        total_expected_income, total_budgeted_expenses, total_received, total_expended = 0, 0, 0, 0
-
-        # Process each budget category
-        for category in self.budget_categories.values():
-            if category.general_classification == 'Income':
-                received = self.income_by_category.get(category.budget_category, 0)
-                pending = category.amt_budgeted - received
-                if category.amt_budgeted != 0 or received != 0:
-                    total_expected_income += category.amt_budgeted
-                    total_received += received
-                    income_data.append(
-                        [category.budget_category, category.amt_budgeted, received, pending])
-            else:
-                expended = self.expenditures_by_category.get(category.budget_category, 0)
-                remaining = category.amt_budgeted - expended
-                if category.amt_budgeted != 0 or expended != 0:
-                    total_budgeted_expenses += category.amt_budgeted
-                    total_expended += expended
-                    expenditures_data.append(
-                        [category.budget_category, category.amt_budgeted, expended, remaining])
+        # The views are built on demand, so build each one once for the whole display
+        income_by_category = self.income_by_category
+        expenditures_by_category = self.expenditures_by_category
+        budget_categories = self.budget_categories
+
+        # One row per category with an amount budgeted or received/expended, using the category lists kept by build_category_lookups
+        income_data, expenditures_data = [], []
+        for name in self._income_categories:
+            category = budget_categories[name]
+            received = income_by_category[name]
+            if category.amt_budgeted != 0 or received != 0:
+                income_data.append([name, category.amt_budgeted, received, category.amt_budgeted - received])
+        for name in self._expenditure_categories:
+            category = budget_categories[name]
+            expended = expenditures_by_category[name]
+            if category.amt_budgeted != 0 or expended != 0:
+                expenditures_data.append([name, category.amt_budgeted, expended, category.amt_budgeted - expended])
 
         if not income_data and not expenditures_data:
             return "\nThere are no budgets to display.\n"
 
+        # Totals are summed from the finished rows' columns
+        total_expected_income = sum(row[1] for row in income_data)
+        total_received = sum(row[2] for row in income_data)
+        total_budgeted_expenses = sum(row[1] for row in expenditures_data)
+        total_expended = sum(row[2] for row in expenditures_data)
+
         # Calculate available to allocate and unspent balance
         available_to_allocate = total_expected_income - total_budgeted_expenses
         unspent_balance = total_budgeted_expenses - total_expended
@@ -720,14 +924,15 @@ class BudgetManager:
         header = f"\n\n\x1B[4mYOUR CURRENT BUDGETS\x1B[0m\nBased on transactions from: {transactions_source if transactions_source else 'N/A'}"
 
         income_section = f"{income_table}\nTotal Expected Income: ${total_expected_income:,.2f}\nTotal Received: ${total_received:,.2f}\nAvailable to allocate: ${available_to_allocate:,.2f}"
-        expenditure_section = f"{expenditures_table}\nUncategorized: ${self.expenditures_by_category.get('Uncategorized', 0):,.2f}\n\nTotal Budgeted: ${total_budgeted_expenses:,.2f}\nTotal Expended: ${total_expended:,.2f}\nUnspent balance: ${unspent_balance:,.2f}"
+        expenditure_section = f"{expenditures_table}\nUncategorized: ${expenditures_by_category.get('Uncategorized', 0):,.2f}\n\nTotal Budgeted: ${total_budgeted_expenses:,.2f}\nTotal Expended: ${total_expended:,.2f}\nUnspent balance: ${unspent_balance:,.2f}"
 
         # Concatenate all the sections into the final display string
         return f"{header}\n\n{income_section}\n\n{expenditure_section}"
 
     def categorize_transaction(self, description):
         """
-        Categorizes a transaction based on its description.
+        Categorizes a transaction based on its description. Bank files repeat the same merchant descriptions many times,
+        so results are cached by description and a repeated description is only lowercased and searched for keywords once.
 
         Args:
             description (str): The description of the transaction.
@@ -735,12 +940,16 @@ class BudgetManager:
         Returns:
             str: The category assigned to the transaction.
         """
-        sorted_categories = sorted(self.budget_categories.values(), key=lambda x: x.search_order) # Sorted function returns a list
-        for category in sorted_categories:
-            for keyword in category.keywords:
-                if keyword.lower() in description.lower():
-                    return category.budget_category
-        return 'Uncategorized'
+        if description in self._category_cache:
+            return self._category_cache[description]
+        category_found = 'Uncategorized'
+        lowered_description = description.lower()  # Lowercased once for every category's keyword pattern
+        for keyword_search, budget_category in self._keyword_searches:
+            if keyword_search(lowered_description):
+                category_found = budget_category
+                break
+        self._category_cache[description] = category_found
+        return category_found
 
 
 class TransactionsManager:
@@ -752,6 +961,10 @@ class TransactionsManager:
         transactions_csv_file (str): The name of the internally created and managed CSV file storing the transaction data (default: 'last_uploaded_transactions.csv').
         transactions (dict): Dictionary mapping transaction numbers to Transaction objects.
     """
+
+    # Column order of the transactions CSV file, matching the order of the Transaction constructor arguments
+    TRANSACTIONS_CSV_HEADER = ['transaction_num', 'transaction_date', 'amount', 'description', 'category', 'source_file']
+
     def __init__(self, source_file='sample.csv', transactions_csv_file='last_uploaded_transactions.csv'):
         """
         Initializes a TransactionsManager object with the provided source file and transactions CSV file.
@@ -766,16 +979,20 @@ class TransactionsManager:
         # Dictionary with BudgetCategory objects as values, and their budget_category attribute as keys
         self.transactions = self.make_transactions_dictionary()
 
-    def make_transactions_dictionary(self, transaction_objects=[Transaction('0', '1900-01-01', '0', 'Sample', 'Uncategorized', 'sample.csv')]):
+    def make_transactions_dictionary(self, transaction_objects=None):
         """
         Creates a dictionary mapping transaction numbers to Transaction objects.
 
         Args:
-            transaction_objects (list): List of Transaction objects (default: [Transaction('0', '1900-01-01', '0', 'Sample', 'Uncategorized', 'sample.csv')]).
+            transaction_objects (list): List of Transaction objects (default: None, which uses a new list holding a single sample transaction,
+            Transaction('0', '1900-01-01', '0', 'Sample', 'Uncategorized', 'sample.csv')).
 
         Returns:
             dict: Dictionary mapping transaction numbers to Transaction objects.
         """
+        if transaction_objects is None:
+            # Built per call, so TransactionsManager objects never share the same sample transaction
+            transaction_objects = [Transaction('0', '1900-01-01', '0', 'Sample', 'Uncategorized', 'sample.csv')]
         self.transaction_objects = transaction_objects
         return {transaction_obj.transaction_num: transaction_obj for transaction_obj in self.transaction_objects}
 
@@ -886,47 +1103,41 @@ class TransactionsManager:
 
     def get_stored_transactions(self):
         """
-        Reads in the stored transaction data from the CSV file. Since the transaction number isn't coming
-        directly from the Transaction object, whose setters will transform the data to an int,
-        manually transforms the transaction number from a numerical string to an integer.
+        Reads in the stored transaction data from the CSV file. Each row becomes a Transaction object through
+        Transaction.from_trusted_row, and the object's own integer transaction number is used as its key.
         If the file doesn't exist, initializes it with default data.
         """
         if not os.path.exists(self.transactions_csv_file):
             self.update_stored_transactions()  # Initialize the file with default data
         else:
-            source_files_in_data = []
-            with open(self.transactions_csv_file, 'r', newline='') as file:
-                reader = csv.DictReader(file)
-                self.transactions = {}  # Prepare to load transactions from file
-                for row in reader:
-                    self.transactions[int(row['transaction_num'])] = Transaction(
-                        row['transaction_num'],
-                        row['transaction_date'],
-                        row['amount'],
-                        row['description'],
-                        row['category'],
-                        row['source_file'])
-                    if row['source_file'] not in source_files_in_data:
-                        source_files_in_data.append(row['source_file'])
-            self.source_file = ', '.join(source_files_in_data)
+            # Collect transactions from file before replacing the ones in memory
+            with open(self.transactions_csv_file, 'r', buffering=CSV_BUFFER_SIZE, newline='') as file:
+                reader = csv.reader(file)
+                next(reader, None)  # Skip the header row
+                transactions = {transaction_obj.transaction_num: transaction_obj for transaction_obj in map(Transaction.from_trusted_row, reader)}
+            self.transactions = transactions
+            # Each source file is listed once, in the order it first appears
+            self.source_file = ', '.join(dict.fromkeys(transaction_obj.source_file for transaction_obj in transactions.values()))
 
     def update_stored_transactions(self):
         """
         Updates the stored transaction data in the CSV file with the current transactions.
-        Overwrites whatever was in the file with the data currently in memory.
-        """
-        with open(self.transactions_csv_file, 'w', newline='') as file:
-            writer = csv.DictWriter(file, fieldnames=[
-                                    'transaction_num', 'transaction_date', 'amount', 'description', 'category', 'source_file'])
-            writer.writeheader()
-            for transaction_obj in self.transactions.values():
-                writer.writerow({
-                    'transaction_num': str(transaction_obj.transaction_num),
-                    'transaction_date': transaction_obj.transaction_date.strftime('%Y-%m-%d'),
-                    'amount': f"{transaction_obj.amount:.2f}",
-                    'description': transaction_obj.description,
-                    'category': transaction_obj.category,
-                    'source_file': transaction_obj.source_file})
+        Overwrites whatever was in the file with the data currently in memory. The data is written to a temporary file
+        first and then moved into place, so an interrupted write never leaves a partial file behind.
+        """
+        temp_file = f"{self.transactions_csv_file}.tmp"
+        with open(temp_file, 'w', buffering=CSV_BUFFER_SIZE, newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(self.TRANSACTIONS_CSV_HEADER)
+            writer.writerows((
+                str(transaction_obj.transaction_num),
+                transaction_obj.transaction_date.date().isoformat(),
+                f"{transaction_obj.amount:.2f}",
+                transaction_obj.description,
+                transaction_obj.category,
+                transaction_obj.source_file
+            ) for transaction_obj in self.transactions.values())
+        os.replace(temp_file, self.transactions_csv_file)
 
     def load_user_transactions(self):
         """
@@ -938,21 +1149,18 @@ class TransactionsManager:
             bool: True if the transactions were loaded successfully, False otherwise.
         """
         try:
-            with open(self.source_file, 'r', newline='') as file:
-                reader = csv.reader(file)
-                self.transactions = {} # Prepare to load transactions from file
-                i = 0
-                for i, row in enumerate(reader, start=1):
-                    self.transactions[i] = Transaction(
-                        i, # Transaction number
-                        datetime.strptime(row[0], '%m/%d/%Y').strftime('%Y-%m-%d'), # Date (reformatted)
-                        row[1], # Amount
-                        row[4] if len(row) >= 5 else "", # Description
-                        'Uncategorized',
-                        self.source_file)
+            with open(self.source_file, 'r', buffering=CSV_BUFFER_SIZE, newline='') as file:
+                # Build every transaction in a single pass, then replace the ones in memory all at once
+                transactions = {i: Transaction(
+                    i, # Transaction number
+                    _us_date_to_iso(row[0]), # Date (reformatted)
+                    row[1], # Amount
+                    row[4] if len(row) >= 5 else "", # Description
+                    'Uncategorized',
+                    self.source_file) for i, row in enumerate(csv.reader(file), start=1)}
         except (FileNotFoundError, IndexError, csv.Error):
             return False
-        self.update_stored_transactions() # Stores initial data
+        self.transactions = transactions  # Stored by the caller once the transactions have been categorized
         return True
 
     def get_transaction_to_update(self):
@@ -989,31 +1197,50 @@ class TransactionsManager:
         Returns:
             str: The formatted string representing the transactions.
          """
+        # attrgetter builds each sort key in C, without calling a Python-level lambda for every transaction
         match sorted_by:
             case 'Transaction number':
-                sort_key = lambda x: x.transaction_num
+                sort_key = attrgetter('transaction_num')
             case 'Transaction date':
-                sort_key = lambda x: x.transaction_date
+                sort_key = attrgetter('transaction_date')
             case 'Amount':
-                sort_key = lambda x: x.amount
+                sort_key = attrgetter('amount')
             case 'Category':
-                sort_key = lambda x: x.category
+                sort_key = attrgetter('category')
             case _:
                 print (f"Cannot sort by {sorted_by}")
-                sort_key = lambda x: x.transaction_num
+                sort_key = attrgetter('transaction_num')
 
         sorted_transactions = sorted(self.transactions.values(), key=sort_key, reverse=not ascending) # Sorted function returns a list
 
-        transactions_for_display = [{
-            'Transaction #': transaction.transaction_num,
-            'Date': transaction.transaction_date.strftime('%Y-%m-%d'),
-            'Amount': f"{transaction.amount:,.2f}",
-            'Description': transaction.description,
-            'Category': transaction.category
-        } for transaction in sorted_transactions]
-
-        # Use tabulate to format the transactions for display
-        display = tabulate(transactions_for_display, headers='keys', tablefmt='grid', floatfmt=".2f")
+        # Rows as tuples, in the same order as the headers, rather than one dictionary per transaction
+        transactions_headers = ['Transaction #', 'Date', 'Amount', 'Description', 'Category']
+        display = None
+        if len(sorted_transactions) >= GRID_TABLE_MIN_ROWS:
+            # Large tables are laid out directly, with cells already formatted the way tabulate displays them
+            transactions_for_display = [(
+                str(transaction.transaction_num),
+                transaction.transaction_date.date().isoformat(),
+                f"{transaction.amount:.2f}",
+                transaction.description,
+                transaction.category
+            ) for transaction in sorted_transactions]
+            # Line breaks, tabs and non-ASCII characters (some of which are double-width) are left to tabulate to lay out
+            text_cells = ''.join(description + category for _, _, _, description, category in transactions_for_display)
+            if text_cells.isascii() and text_cells.isprintable():
+                display = _grid_table(transactions_headers, transactions_for_display, [True, False, True, False, False])
+
+        if display is None:
+            transactions_for_display = [(
+                transaction.transaction_num,
+                transaction.transaction_date.date().isoformat(),
+                f"{transaction.amount:,.2f}",
+                transaction.description,
+                transaction.category
+            ) for transaction in sorted_transactions]
+
+            # Use tabulate to format the transactions for display
+            display = tabulate(transactions_for_display, headers=transactions_headers, tablefmt='grid', floatfmt=".2f")
         return f"\n\n\x1B[4mLAST UPLOADED TRANSACTIONS\x1B[0m\nTransactions from: {self.source_file}\n\n{display}"
 
 
@@ -1040,18 +1267,8 @@ class FinancialController:
         """
         Calculates the totals for income and expenditures by category.
         """
-        self.budget_manager.income_by_category = {category: 0.0 for category in self.budget_manager.income_by_category}
-        self.budget_manager.expenditures_by_category = {category: 0.0 for category in self.budget_manager.expenditures_by_category}
-
-        # Bank CSV files treat transactions coming into the account as positive, and transactions going out of the account as negative.
-        # Switch the signs of expenditures to display as positive amounts
-        for transaction in self.transactions_manager.transactions.values():
-            if transaction.category in self.budget_manager.income_by_category:
-                self.budget_manager.income_by_category[transaction.category] += transaction.amount
-            elif transaction.category in self.budget_manager.expenditures_by_category:
-                self.budget_manager.expenditures_by_category[transaction.category] -= transaction.amount
-            else:
-                self.budget_manager.expenditures_by_category['Uncategorized'] -= transaction.amount
+        self.budget_manager.reset_totals()
+        self.budget_manager.add_transactions_to_totals(self.transactions_manager.transactions.values())
 
     def view_current_budgets(self):
         """
@@ -1074,8 +1291,11 @@ class FinancialController:
         """
         Categorizes all transactions based on their descriptions.
         """
+        # Descriptions are passed as they are: categorize_transaction lowercases each new description once and caches the result,
+        # so a repeated description costs a method call and a dictionary lookup
+        categorize_transaction = self.budget_manager.categorize_transaction
         for transaction in self.transactions_manager.transactions.values():
-            transaction.category = self.budget_manager.categorize_transaction(transaction.description.lower())
+            transaction.category = categorize_transaction(transaction.description)
 
     def process_user_transactions(self, user_filename):
         """
@@ -1118,6 +1338,7 @@ class FinancialController:
         are displayed. When the user selects a budget category by option number, the chosen transaction is reclassified to that budget category.
         Changes to both the transactions and the budgets with expenditures that result from recategorization are displayed, and the user can
         select another transaction number to recategorize. The process continues until the user enters 'q'.
+        The stored transactions file is rewritten once when the user leaves this menu, rather than after every change.
 
         Args:
             sort_order (str): The order in which to sort the transactions for display (default: 'Category').
@@ -1125,30 +1346,57 @@ class FinancialController:
         Returns:
             str: 'q' if the user chooses to quit out of the current menu.
         """
-        while True:
-            print(self.transactions_manager.formatted_transactions(sort_order))
-            # Gets and validates transaction number
-            transaction_to_update = self.transactions_manager.get_transaction_to_update()
-            if not transaction_to_update:
-                # Let the user know their selection was invalid before reprompting
-                print("Invalid transaction number. Please try again.")
-                continue
-            if transaction_to_update == 'q':
-                return 'q'  # Lets calling function know user wants to quit out of current menu
+        # Start from up-to-date totals, so each recategorization only has to move one amount between categories
+        self.calculate_totals_by_category()
+        unsaved_changes = False
+        try:
             while True:
-                print(self.budget_manager.budget_menu)
-                new_category = self.budget_manager.get_budget_category_to_update()
-                if not new_category:
-                    print('Please select from the available categories')
-                    continue  # Let user try entering the category again, in case they just miskeyed the input
-                if new_category == 'q':   # If user enters 'q' instead of an amount, they may have meant to choose a different transaction
+                print(self.transactions_manager.formatted_transactions(sort_order))
+                # Gets and validates transaction number
+                transaction_to_update = self.transactions_manager.get_transaction_to_update()
+                if not transaction_to_update:
+                    # Let the user know their selection was invalid before reprompting
+                    print("Invalid transaction number. Please try again.")
+                    continue
+                if transaction_to_update == 'q':
+                    return 'q'  # Lets calling function know user wants to quit out of current menu
+                while True:
+                    print(self.budget_manager.budget_menu)
+                    new_category = self.budget_manager.get_budget_category_to_update()
+                    if not new_category:
+                        print('Please select from the available categories')
+                        continue  # Let user try entering the category again, in case they just miskeyed the input
+                    if new_category == 'q':   # If user enters 'q' instead of an amount, they may have meant to choose a different transaction
+                        break
+                    transaction_obj = self.transactions_manager.transactions[transaction_to_update]
+                    # Move the transaction's amount from its old category's total to the new one instead of recalculating every total
+                    self.budget_manager.add_to_totals(transaction_obj.category, -transaction_obj.amount)
+                    transaction_obj.category = new_category
+                    self.budget_manager.add_to_totals(new_category, transaction_obj.amount)
+                    unsaved_changes = True
+                    print(self.budget_manager.format_budgets_with_expenditures(self.transactions_manager.source_file))
                     break
-                self.transactions_manager.transactions[transaction_to_update].category = new_category
+        finally:
+            # Also runs when the user exits the program from within this menu
+            if unsaved_changes:
                 self.transactions_manager.update_stored_transactions()
-                self.calculate_totals_by_category()
-                print(self.budget_manager.format_budgets_with_expenditures(self.transactions_manager.source_file))
-                break
 
+@functools.lru_cache(maxsize=8)
+def _get_figlet(user_font):
+    """
+    Returns a Figlet renderer for the given font, so each font file is only parsed once.
+
+    Args:
+        user_font (str): The name of the FIGlet font to be used.
+
+    Returns:
+        Figlet: The renderer for the font.
+    """
+    from pyfiglet import Figlet  # Imported here so font loading is only paid for when a banner is drawn
+
+    return Figlet(font=user_font)
+
+@functools.lru_cache(maxsize=8)
 def generate_figlet(phrase, user_font):
     """
     Generates a FIGlet text art representation of a given phrase using the specified font.
@@ -1161,12 +1409,14 @@ def generate_figlet(phrase, user_font):
         str: The FIGlet text art representation of the phrase if the font is valid.
         str: "Invalid Font" if the specified font is not available or invalid.
     """
+    from pyfiglet import FigletError
+
     try:
-        figlet = Figlet(font=user_font)
-        return figlet.renderText(phrase)
+        return _get_figlet(user_font).renderText(phrase)
     except FigletError:
         return f"Invalid Font"
 
+@functools.lru_cache(maxsize=8)
 def generate_cow(phrase):
     """
     Generates a cowsay representation of a given phrase.
@@ -1177,6 +1427,8 @@ def generate_cow(phrase):
     Returns:
         str: The cowsay representation of the phrase.
     """
+    import cowsay  # Imported here so the module loads without it until a cow is needed
+
     return cowsay.get_output_string('cow', phrase)
 
 
@@ -1232,7 +1484,7 @@ def validate_csv_file(instructions='', input_prompt=''):
             return 'q'
         if not proposed_file.endswith('.csv'):
             proposed_file += '.csv'  # Since only CSV files are accepted, add the extension then look for the given name in the project folder as a CSV file
-        if not os.path.exists(proposed_file):
+        if not os.path.isfile(proposed_file):  # A single stat call, which also rejects a directory whose name ends in '.csv'
             print(f"The file '{proposed_file}' is invalid. Please try again, or enter 'q' to return to main menu:")
             continue
         return proposed_file
@@ -1267,6 +1519,8 @@ def main():
          'option title': 'Recategorize transactions',
          'option number': '6',
          }]
+    # The main menu never changes, so it is built once rather than re-sorted on every pass through the loop
+    main_menu_display = generate_menu(main_menu, "MAIN MENU")
 
     controller = FinancialController()
 
@@ -1277,7 +1531,7 @@ def main():
 
 
     while True:
-        print(generate_menu(main_menu, "MAIN MENU"))
+        print(main_menu_display)
         try:
             selection = input("Please enter option number or 'q' to exit: ")
             if selection.lower() == 'q':
@@ -0,0 +1,54 @@
+import unittest
+from unittest import mock
+
+from tabulate import tabulate
+
+import cs50final
+from cs50final import Transaction, TransactionsManager, _grid_table
+
+
+HEADERS = ['Transaction #', 'Date', 'Amount', 'Description', 'Category']
+
+
+def make_transactions_manager(descriptions):
+    """
+    Returns a TransactionsManager holding one transaction per description, cycling through a few amounts and categories.
+    """
+    amounts = ['2500.00', '-45.12', '-5.75', '-1234.50']
+    categories = ['Paycheck', 'Groceries', 'Uncategorized', 'Pay Loans & Credit Cards']
+    transactions_manager = TransactionsManager()
+    transactions_manager.transactions = {i: Transaction(i, f'2024-01-{i % 28 + 1:02d}', amounts[i % 4], description, categories[i % 4], 'bank.csv')
+                                         for i, description in enumerate(descriptions, start=1)}
+    return transactions_manager
+
+
+class TestGridTable(unittest.TestCase):
+    def test_matches_tabulate_grid(self):
+        rows = [
+            ('1', '2024-01-05', '2500.00', 'PAYROLL ACME INC', 'Paycheck'),
+            ('2', '2024-01-06', '-45.12', '  SAFEWAY #1234', 'Groceries'),
+            ('10', '2024-01-07', '-5.75', 'STARBUCKS STORE 55  ', 'Uncategorized'),
+            ('204', '2024-01-08', '-1234.50', '', 'Pay Loans & Credit Cards'),
+        ]
+        expected = tabulate(rows, headers=HEADERS, tablefmt='grid', floatfmt='.2f')
+        self.assertEqual(_grid_table(HEADERS, rows, [True, False, True, False, False]), expected)
+
+
+class TestFormattedTransactions(unittest.TestCase):
+    def assert_matches_tabulate(self, transactions_manager):
+        for sorted_by, ascending in [('Transaction number', True), ('Amount', False), ('Category', True)]:
+            display = transactions_manager.formatted_transactions(sorted_by, ascending)
+            with mock.patch.object(cs50final, 'GRID_TABLE_MIN_ROWS', float('inf')):
+                self.assertEqual(display, transactions_manager.formatted_transactions(sorted_by, ascending))
+
+    def test_large_table_matches_tabulate(self):
+        descriptions = ['  PAYROLL ACME', 'AMAZON MKTPLACE  ', 'SOMETHING, WITH COMMA', 'VCA ANIMAL HOSPITAL']
+        self.assert_matches_tabulate(make_transactions_manager(descriptions * 51))
+
+    def test_large_table_with_multiline_and_wide_cells_matches_tabulate(self):
+        descriptions = ['PAYROLL\nACME', 'CAFÉ', '東京 STORE', 'TAB\tSEPARATED']
+        self.assert_matches_tabulate(make_transactions_manager(descriptions * 51))
+
+
+if __name__ == '__main__':
+    unittest.main()